@@ -1,30 +1,155 @@
+import asyncio
 import json
+import os
 import time
-from nba_api.stats.static import players
-from nba_api.stats.endpoints import commonplayerinfo
+from requests.exceptions import ReadTimeout, ConnectionError as RequestsConnectionError
+from nba_api.stats.library.http import NBAStatsHTTP
+
+MAX_CONCURRENT_REQUESTS = 8
+REQUEST_DELAY = 0.6  # Per-worker pause to avoid hitting rate limits
+POSITIONS_FILE = 'player_positions.json'
+CACHE_TTL = 30 * 86400  # Positions rarely change, refetch after 30 days
+POSITION_NAMES = {'G': 'Guard', 'F': 'Forward', 'C': 'Center'}
+SAVE_EVERY = 25  # Persist progress after this many per-player fetches
+PROGRESS_EVERY = 25  # Print a progress line after this many per-player fetches
+
+def nba_call_with_retry(endpoint_cls, retries=3, **kwargs):
+    """Call an nba_api endpoint, starting a fresh session and backing off after a timeout."""
+    for attempt in range(retries):
+        try:
+            return endpoint_cls(**kwargs)
+        except (ReadTimeout, RequestsConnectionError):
+            if attempt == retries - 1:
+                raise
+            # A timed out connection leaves nba_api's shared session stuck, so drop it
+            NBAStatsHTTP._session = None
+            time.sleep(2 ** attempt)
+
+def load_cached_positions(path=POSITIONS_FILE):
+    """Load previously fetched positions keyed by player id."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return {p['id']: p for p in json.load(f)}
+
+def save_positions(player_data, path=POSITIONS_FILE):
+    """Write positions to disk, replacing the old file only once the new one is complete."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(player_data, f)
+    os.replace(tmp_path, path)
+
+def is_fresh(record, now):
+    """Check whether a cached record is still within the cache TTL."""
+    return now - record.get('fetched_at', 0) < CACHE_TTL
+
+def make_record(player, position):
+    """Build the record stored in player_positions.json."""
+    return {
+        'id': player['id'],
+        'name': player['full_name'],
+        'position': position,
+        'fetched_at': time.time()
+    }
+
+def fetch_position_index():
+    """Fetch positions for all current players in a single PlayerIndex request."""
+    # The dashboard imports this module for its helpers, so endpoints are only loaded when used
+    from nba_api.stats.endpoints import playerindex
+    index = nba_call_with_retry(playerindex.PlayerIndex)
+    positions = {}
+    for row in index.get_normalized_dict()['PlayerIndex']:
+        # PlayerIndex abbreviates positions (e.g. 'F-C'), expand them to match CommonPlayerInfo
+        abbreviations = row['POSITION'].split('-') if row['POSITION'] else []
+        positions[row['PERSON_ID']] = '-'.join(POSITION_NAMES.get(a, a) for a in abbreviations)
+    return positions
+
+def fetch_player_position(player):
+    """Fetch a single player's position via CommonPlayerInfo."""
+    from nba_api.stats.endpoints import commonplayerinfo
+    info = nba_call_with_retry(commonplayerinfo.CommonPlayerInfo, player_id=player['id'])
+    position = info.get_normalized_dict()['CommonPlayerInfo'][0]['POSITION']
+    return make_record(player, position)
+
+async def fetch_one(sem, player):
+    """Fetch one player's position while holding a slot of the semaphore."""
+    async with sem:
+        try:
+            # nba_api is built on requests, so run the blocking call in a worker thread
+            return await asyncio.to_thread(fetch_player_position, player)
+        finally:
+            await asyncio.sleep(REQUEST_DELAY)
+
+async def gather_positions(all_players, on_fetched=None):
+    """Fetch positions for all players with a bounded number of requests in flight."""
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    completed = 0
+
+    async def fetch_with_progress(player):
+        nonlocal completed
+        try:
+            record = await fetch_one(sem, player)
+        finally:
+            completed += 1
+            if completed % PROGRESS_EVERY == 0:
+                print(f"{completed}/{len(all_players)}")
+        if on_fetched:
+            on_fetched(record)
+        return record
+
+    tasks = [fetch_with_progress(player) for player in all_players]
+    return await asyncio.gather(*tasks, return_exceptions=True)
 
 def fetch_all_player_positions():
+    from nba_api.stats.static import players
     all_players = players.get_active_players()
-    player_data = []
 
-    for player in all_players:
-        player_id = player['id']
+    # Only fetch players that are new or whose cached record has expired
+    known = load_cached_positions()
+    now = time.time()
+    to_fetch = [p for p in all_players if not (p['id'] in known and is_fresh(known[p['id']], now))]
+
+    def collect_player_data():
+        # Keep the active-player ordering, falling back to the stale record if a refetch failed
+        player_data = []
+        for player in all_players:
+            record = fetched.get(player['id']) or known.get(player['id'])
+            if record:
+                player_data.append(record)
+        return player_data
+
+    # A single PlayerIndex request covers nearly every active player
+    fetched = {}
+    index = {}
+    if to_fetch:
         try:
-            info = commonplayerinfo.CommonPlayerInfo(player_id=player_id)
-            position = info.get_normalized_dict()['CommonPlayerInfo'][0]['POSITION']
-            player_data.append({
-                'id': player_id,
-                'name': player['full_name'],
-                'position': position
-            })
-            print(player_data)
+            index = fetch_position_index()
         except Exception as e:
-            print(f"Error fetching data for {player['full_name']}: {e}")
-        time.sleep(0.6)  # Avoid hitting rate limits
+            print(f"Error fetching player index: {e}")
+    for player in to_fetch:
+        if player['id'] in index:
+            fetched[player['id']] = make_record(player, index[player['id']])
+    if index:
+        save_positions(collect_player_data())
+
+    # Fall back to per-player requests for anyone missing from the index,
+    # saving periodically so an interrupted run resumes where it left off
+    def on_fetched(record):
+        fetched[record['id']] = record
+        if len(fetched) % SAVE_EVERY == 0:
+            save_positions(collect_player_data())
+
+    remaining = [p for p in to_fetch if p['id'] not in fetched]
+    results = asyncio.run(gather_positions(remaining, on_fetched))
+    for player, result in zip(remaining, results):
+        if isinstance(result, Exception):
+            print(f"Error fetching data for {player['full_name']}: {result}")
+
+    player_data = collect_player_data()
+    print(f"Fetched {len(fetched)} players, {len(player_data)} positions saved")
 
     # Save to JSON or CSV
-    with open('player_positions.json', 'w') as f:
-        json.dump(player_data, f)
+    save_positions(player_data)
 
 if __name__ == "__main__":
     fetch_all_player_positions()
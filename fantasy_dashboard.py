@@ -1,19 +1,153 @@
 import sys
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel, QComboBox, QLineEdit,
-    QPushButton, QHBoxLayout, QCompleter, QTabWidget, QListWidget, QFormLayout, QGraphicsDropShadowEffect
+    QPushButton, QHBoxLayout, QCompleter, QTabWidget, QListWidget, QFormLayout
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QFont, QColor, QPalette
+from PyQt6.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, QTimer, QStringListModel, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QFont, QPalette
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+from matplotlib.ticker import AutoLocator, ScalarFormatter
+from matplotlib import style as mpl_style
+import os
+import importlib.metadata
 import time
 import json
+import pickle
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from requests.exceptions import ReadTimeout
-from nba_api.stats.static import players
-from nba_api.stats.endpoints import playercareerstats, commonplayerinfo
+from dataload import POSITIONS_FILE, nba_call_with_retry
+
+DEBOUNCE_MS = 80  # Delay before acting on dropdown changes so rapid scrolling triggers one update
+COMPLETION_DEBOUNCE_MS = 150  # Pause in typing before the player completer filters its list
+
+# Stat columns that contribute to the fantasy score, in fantasy_coef order
+FANTASY_STATS = ['PTS', 'REB', 'AST', 'STL', 'BLK', 'TO']
+
+# Career stats columns kept after a fetch, everything else nba_api returns is unused
+CAREER_COLUMNS = ['SEASON_ID', 'GP'] + FANTASY_STATS
+
+# Metrics offered in the comparison dropdown, all derived in load_player_data
+METRICS = ["Fantasy Score", "Points Per Game", "Assists", "Rebounds", "Efficiency", "Steals", "Blocks"]
+
+# Projections tab labels and the load_player_data columns they read from
+PROJECTION_COLUMNS = {
+    "Points": "Points Per Game",
+    "Rebounds": "Rebounds",
+    "Assists": "Assists",
+    "Fantasy Score": "Fantasy Score Per Game",
+}
+
+CAREER_CACHE_FILE = os.path.expanduser('~/.nba_dash_cache.pkl')
+CAREER_CACHE_TTL = 3600  # Current-season totals change daily, so keep cached careers for an hour
+CAREER_CACHE_SIZE = 256  # Most recently used players kept in the career stats cache
+CAREER_CACHE_VERSION = 1  # Bump whenever the layout of cached career frames changes
+PLAYERS_CACHE_FILE = os.path.expanduser('~/.nba_dash_players.pkl')
+
+def load_career_cache(path=CAREER_CACHE_FILE):
+    """Load cached career stats from disk, dropping entries older than the TTL.
+
+    A cache written with another layout version, or one that can't be read, is discarded.
+    """
+    try:
+        with open(path, 'rb') as f:
+            cache = pickle.load(f)
+        if cache.get('version') != CAREER_CACHE_VERSION:
+            return OrderedDict()
+        now = time.time()
+        return OrderedDict(
+            (pid, (fetched_at, df)) for pid, (fetched_at, df) in cache['entries'].items()
+            if now - fetched_at < CAREER_CACHE_TTL and list(df.columns) == CAREER_COLUMNS
+        )
+    except FileNotFoundError:
+        return OrderedDict()
+    except Exception as e:
+        # DataFrames pickled by another pandas version fail in many different ways
+        print(f"Ignoring unreadable career stats cache: {e}")
+        return OrderedDict()
+
+def save_career_cache(cache, path=CAREER_CACHE_FILE):
+    """Persist cached career stats so the next session can reuse them."""
+    try:
+        with open(path, 'wb') as f:
+            pickle.dump({'version': CAREER_CACHE_VERSION, 'entries': cache}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"Error saving career stats cache: {e}")
+
+def load_active_players(path=PLAYERS_CACHE_FILE):
+    """Load the active player list, reusing a pickled copy until the installed nba_api changes."""
+    # Read the version from package metadata, a cache hit never needs to import nba_api
+    try:
+        nba_api_version = importlib.metadata.version('nba_api')
+    except importlib.metadata.PackageNotFoundError:
+        # A vendored or source checkout has no metadata, so there is no version to check a cache against
+        from nba_api.stats.static import players
+        return players.get_active_players()
+    try:
+        with open(path, 'rb') as f:
+            cache = pickle.load(f)
+        if cache['nba_api_version'] == nba_api_version:
+            return cache['players']
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Ignoring unreadable player list cache: {e}")
+    from nba_api.stats.static import players
+    active_players = players.get_active_players()
+    try:
+        with open(path, 'wb') as f:
+            pickle.dump({'nba_api_version': nba_api_version, 'players': active_players}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"Error saving player list cache: {e}")
+    return active_players
+
+@lru_cache(maxsize=None)
+def load_player_index():
+    """Build the active player list, lowercase name lookup and sorted names once per process."""
+    # Names, lookups and completers all derive from this one list
+    all_players = load_active_players()
+    # Index players by lowercase name for constant-time search lookups
+    player_by_lname = {p['full_name'].lower(): p for p in all_players}
+    # Sort by the keys lowered above rather than lowering every name again
+    player_names = [player_by_lname[name]['full_name'] for name in sorted(player_by_lname)]
+    return all_players, player_by_lname, player_names
+
+def _fetch_career_df(player_id):
+    """Fetch a player's regular season career totals from stats.nba.com."""
+    # Importing the endpoints package loads every nba_api endpoint, so defer it to the first fetch
+    from nba_api.stats.endpoints import playercareerstats
+    career_stats = nba_call_with_retry(playercareerstats.PlayerCareerStats, player_id=player_id)
+    # nba_api names the turnover column TOV, the fantasy settings call it TO
+    df = career_stats.get_data_frames()[0].rename(columns={'TOV': 'TO'})
+    # Keep only the columns used downstream. Older seasons may lack some stats, so fill
+    # them here and every cached frame shares one schema
+    return df.reindex(columns=CAREER_COLUMNS, fill_value=0)
+
+def compute_metrics(stats, gp, coef):
+    """Derive the plotted metrics from raw season totals.
+
+    stats holds one row per season with FANTASY_STATS columns, gp the games played per row
+    and coef the fantasy weights. Rows are independent, so seasons from many players can be
+    stacked into one call.
+    """
+    # Per-game PTS, REB, AST, STL and BLK in one broadcast division by GP
+    per_game = stats[:, :5] / gp[:, None]
+    # Add fantasy score using user-defined settings
+    fantasy_score = stats @ coef
+    return {
+        'Fantasy Score': fantasy_score,
+        'Fantasy Score Per Game': fantasy_score / gp,
+        'Points Per Game': per_game[:, 0],
+        'Rebounds': per_game[:, 1],
+        'Assists': per_game[:, 2],
+        'Efficiency': per_game[:, :3].sum(axis=1),
+        'Steals': per_game[:, 3],
+        'Blocks': per_game[:, 4],
+    }
 
 class StyledQLabel(QLabel):
     """Custom label with improved styling"""
@@ -26,30 +160,43 @@ class StyledQLabel(QLabel):
         self.setStyleSheet(f"color: {color};")
 
 class StyledQPushButton(QPushButton):
-    """Custom button with modern styling"""
+    """Custom button with modern styling
+
+    The styling itself lives in the main window stylesheet under the "styled" class,
+    so Qt parses it once instead of once per button.
+    """
     def __init__(self, text):
         super().__init__(text)
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #2C3E50;
-                color: white;
-                border-radius: 5px;
-                padding: 8px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #34495E;
-            }
-            QPushButton:pressed {
-                background-color: #2980B9;
-            }
-        """)
-        # Add subtle shadow effect
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(15)
-        shadow.setColor(QColor("#888888"))
-        shadow.setOffset(3, 3)
-        self.setGraphicsEffect(shadow)
+        self.setProperty("class", "styled")
+
+
+class PlayerCompleter(QCompleter):
+    """Completer that normalizes the typed prefix once before matching"""
+    def splitPath(self, path):
+        # Ignore stray whitespace so " lebron" still completes
+        return [path.strip().lower()]
+
+
+class WorkerSignals(QObject):
+    """Signals a StatsWorker uses to report back to the GUI thread"""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class StatsWorker(QRunnable):
+    """Runs a blocking career stats fetch on the shared thread pool"""
+    def __init__(self, fetch, *args):
+        super().__init__()
+        self.fetch = fetch
+        self.args = args
+        self.signals = WorkerSignals()
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            self.signals.finished.emit(self.fetch(*self.args))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
 
 
 class FantasyDashboard(QMainWindow):
@@ -79,6 +226,23 @@ class FantasyDashboard(QMainWindow):
                 border: 1px solid #BDC3C7;
                 border-radius: 5px;
             }
+            QPushButton[class="styled"] {
+                background-color: #2C3E50;
+                color: white;
+                border: 1px solid #2C3E50;
+                border-bottom: 3px solid #1A252F;
+                border-radius: 5px;
+                padding: 8px;
+                font-weight: bold;
+            }
+            QPushButton[class="styled"]:hover {
+                background-color: #34495E;
+                border-color: #34495E;
+                border-bottom-color: #1A252F;
+            }
+            QPushButton[class="styled"]:pressed {
+                background-color: #2980B9;
+            }
         """)
 
         # Rest of the initialization remains the same as in the original code
@@ -86,11 +250,19 @@ class FantasyDashboard(QMainWindow):
         self.setGeometry(100, 100, 1400, 900)
 
         # Matplotlib style
-        plt.style.use('bmh')
+        mpl_style.use('bmh')
         self.current_player_1 = None
         self.current_player_2 = None
         self.data_1 = None
         self.data_2 = None
+        # Line data per (metric, normalization) for the currently loaded players
+        self._plot_cache = {}
+        self.career_cache = load_career_cache()
+        self._cache_lock = threading.Lock()
+        self.stats_workers = set()
+        # Latest request id per plot slot, so slow responses can't overwrite newer searches
+        self._request_counter = 0
+        self._latest_request = {}
 
         self.fantasy_settings = {
             'PTS': 1,
@@ -100,22 +272,59 @@ class FantasyDashboard(QMainWindow):
             'BLK': 3,
             'TO': -1
         }
+        self.update_fantasy_coef()
 
         # Create tabs and add them to the tab widget
-        with open('player_positions.json', 'r') as f:
-            self.player_positions = json.load(f)
-
-        # Extract player names and initialize UI
-        self.player_names = [player['name'] for player in self.player_positions]
-        self.all_players = players.get_active_players()
+        self.player_positions = json.loads(Path(POSITIONS_FILE).read_bytes())
+
+        # Bucket player names by position once so filtering is a dict lookup
+        self.names_by_position = {'All': [], 'Guard': [], 'Forward': [], 'Center': []}
+        for player in self.player_positions:
+            self.names_by_position['All'].append(player['name'])
+            for position in ('Guard', 'Forward', 'Center'):
+                if position in player['position']:
+                    self.names_by_position[position].append(player['name'])
+
+        # Player lists are static, so every window shares the module-level index
+        self.all_players, self.player_by_lname, self.player_names = load_player_index()
+        # One shared model lets every completer binary search the sorted names
+        self._name_model = QStringListModel(self.player_names, self)
         # Tab widget for switching pages
         self.tabs = QTabWidget()
         self.setCentralWidget(self.tabs)
 
-        # Create tabs
+        # Create tabs. Only the first tab is built up front, the rest are
+        # built the first time they are shown.
         self.create_player_stats_tab()
-        self.create_position_filter_tab()
-        self.create_settings_tab()
+        self._lazy_tabs = {}
+        for label, build in (
+            ("Per-Game Projections", self.create_projections_tab),
+            ("Position Filter", self.create_position_filter_tab),
+            ("Settings", self.create_settings_tab),
+        ):
+            self._lazy_tabs[self.tabs.addTab(QWidget(), label)] = build
+        self.tabs.currentChanged.connect(self._lazy_init_tab)
+
+    def _lazy_init_tab(self, index):
+        """Swap a placeholder tab for its real contents the first time it is shown."""
+        build = self._lazy_tabs.pop(index, None)
+        if build is None:
+            return
+        label = self.tabs.tabText(index)
+        placeholder = self.tabs.widget(index)
+        # Removing the current tab would otherwise re-enter this slot
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, build(), label)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+
+    def closeEvent(self, event):
+        """Persist the career stats cache before the window closes."""
+        with self._cache_lock:
+            save_career_cache(self.career_cache)
+        super().closeEvent(event)
 
     def create_settings_tab(self):
         """Create the Settings tab with improved styling"""
@@ -157,17 +366,23 @@ class FantasyDashboard(QMainWindow):
         save_button.clicked.connect(self.save_settings)
         layout.addWidget(save_button)
 
-        self.tabs.addTab(settings_widget, "Settings")
+        return settings_widget
 
     def save_settings(self):
         """Save the custom fantasy points settings."""
         try:
             for stat_key in self.fantasy_settings.keys():
                 self.fantasy_settings[stat_key] = float(self.stat_inputs[stat_key].text())
+            self.update_fantasy_coef()
             print("Settings saved successfully.")
         except ValueError:
             print("Invalid input. Please enter numeric values.")
 
+    def update_fantasy_coef(self):
+        """Rebuild the fantasy score weight vector from the current settings."""
+        # The TO setting is already negative, so every weight is used as entered
+        self.fantasy_coef = np.array([self.fantasy_settings[stat] for stat in FANTASY_STATS], dtype=np.float64)
+
     def create_player_stats_tab(self):
         """Create the Player Stats tab."""
         player_stats_widget = QWidget()
@@ -178,10 +393,49 @@ class FantasyDashboard(QMainWindow):
         self.setup_player_stats_tab()
         self.tabs.addTab(self.player_stats_tab, "Compare Players")
 
-        # Projections Tab
+    def create_projections_tab(self):
+        """Create the Per-Game Projections tab."""
         self.projections_tab = QWidget()
         self.setup_projections_tab()
-        self.tabs.addTab(self.projections_tab, "Per-Game Projections")
+        return self.projections_tab
+
+    def create_player_completer(self, line_edit, on_submit):
+        """Attach a case-insensitive completer backed by the shared, presorted name model.
+
+        The completer is driven manually rather than through setCompleter, so it only
+        filters once typing pauses instead of on every keystroke. on_submit runs when
+        Return is pressed outside the completer popup.
+        """
+        completer = PlayerCompleter(self._name_model, self)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        completer.setModelSorting(QCompleter.ModelSorting.CaseInsensitivelySortedModel)
+        # Qt only binary searches sorted models for prefix matches, so pin the filter mode
+        completer.setFilterMode(Qt.MatchFlag.MatchStartsWith)
+        completer.setWidget(line_edit)
+        completer.activated.connect(line_edit.setText)
+        # Preview the highlighted name while arrowing through suggestions, as setCompleter would
+        completer.highlighted.connect(line_edit.setText)
+
+        def submit():
+            # Return reaches the line edit before the completer fills in the chosen name, so
+            # leave it to the completer while the popup is open rather than search partial text
+            if not completer.popup().isVisible():
+                on_submit()
+        line_edit.returnPressed.connect(submit)
+
+        timer = QTimer(line_edit)
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda: self.run_completion(completer, line_edit.text()))
+        line_edit.textEdited.connect(lambda _: timer.start(COMPLETION_DEBOUNCE_MS))
+        return completer
+
+    def run_completion(self, completer, text):
+        """Filter the completer by the typed text and show its popup."""
+        if not text.strip():
+            completer.popup().hide()
+            return
+        completer.setCompletionPrefix(text)
+        completer.complete()
 
     def setup_player_stats_tab(self):
         """Enhanced player stats tab with better layout, styling, and autocomplete"""
@@ -203,9 +457,7 @@ class FantasyDashboard(QMainWindow):
         self.search_bar_1.setPlaceholderText("Search Player 1...")
         
         # Add autocomplete for player 1
-        player1_completer = QCompleter(self.player_names)
-        player1_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self.search_bar_1.setCompleter(player1_completer)
+        self.create_player_completer(self.search_bar_1, lambda: self.search_player(1))
         
         player1_section.addWidget(self.search_bar_1)
         search_layout.addLayout(player1_section)
@@ -217,9 +469,7 @@ class FantasyDashboard(QMainWindow):
         self.search_bar_2.setPlaceholderText("Search Player 2...")
         
         # Add autocomplete for player 2
-        player2_completer = QCompleter(self.player_names)
-        player2_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self.search_bar_2.setCompleter(player2_completer)
+        self.create_player_completer(self.search_bar_2, lambda: self.search_player(2))
         
         player2_section.addWidget(self.search_bar_2)
         search_layout.addLayout(player2_section)
@@ -232,7 +482,7 @@ class FantasyDashboard(QMainWindow):
         metric_section = QVBoxLayout()
         metric_section.addWidget(StyledQLabel("Select Metric", bold=True))
         self.metric_dropdown = QComboBox()
-        self.metric_dropdown.addItems(["Fantasy Score", "Points Per Game", "Assists", "Rebounds", "Efficiency", "Steals", "Blocks"])
+        self.metric_dropdown.addItems(METRICS)
         metric_section.addWidget(self.metric_dropdown)
         dropdown_container.addLayout(metric_section)
 
@@ -246,14 +496,24 @@ class FantasyDashboard(QMainWindow):
         layout.addLayout(dropdown_container)
 
         # Matplotlib figure for comparison with better styling
-        plt.style.use('seaborn-v0_8-whitegrid')
+        mpl_style.use('seaborn-v0_8-whitegrid')
         self.figure = Figure(figsize=(10, 6), dpi=100, facecolor='#ECF0F1')
         self.canvas = FigureCanvas(self.figure)
         layout.addWidget(self.canvas)
 
-        # Connect dropdowns to update function
-        self.metric_dropdown.currentIndexChanged.connect(self.update_plot)
-        self.normalization_dropdown.currentIndexChanged.connect(self.update_plot)
+        # Create the axes and one line per player once; update_plot only swaps their data
+        self.ax = self.figure.add_subplot(111)
+        self.ax.grid(True)
+        self.line1, = self.ax.plot([], [], marker='o')
+        self.line2, = self.ax.plot([], [], marker='x')
+        self._legend_labels = None
+
+        # Connect dropdowns to update function, debounced so only the final selection replots
+        self._replot_timer = QTimer(self)
+        self._replot_timer.setSingleShot(True)
+        self._replot_timer.timeout.connect(self.update_plot)
+        self.metric_dropdown.currentIndexChanged.connect(lambda _: self._replot_timer.start(DEBOUNCE_MS))
+        self.normalization_dropdown.currentIndexChanged.connect(lambda _: self._replot_timer.start(DEBOUNCE_MS))
 
         # Search buttons
         search_buttons_layout = QHBoxLayout()
@@ -265,6 +525,10 @@ class FantasyDashboard(QMainWindow):
         search_button_2.clicked.connect(lambda: self.search_player(2))
         search_buttons_layout.addWidget(search_button_2)
 
+        compare_button = StyledQPushButton("Compare Players")
+        compare_button.clicked.connect(self.search_both_players)
+        search_buttons_layout.addWidget(compare_button)
+
         layout.addLayout(search_buttons_layout)
 
     def setup_projections_tab(self):
@@ -274,9 +538,7 @@ class FantasyDashboard(QMainWindow):
         search_layout = QHBoxLayout()
         self.projection_search_bar = QLineEdit()
         self.projection_search_bar.setPlaceholderText("Search Player for Projections...")
-        self.projection_completer = QCompleter(self.player_names)
-        self.projection_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self.projection_search_bar.setCompleter(self.projection_completer)
+        self.projection_completer = self.create_player_completer(self.projection_search_bar, self.generate_projections)
         search_button = QPushButton("Search")
         search_button.clicked.connect(self.generate_projections)
         search_layout.addWidget(self.projection_search_bar)
@@ -292,19 +554,83 @@ class FantasyDashboard(QMainWindow):
         self.projection_canvas = FigureCanvas(self.projection_figure)
         layout.addWidget(self.projection_canvas)
 
+        # Create the bars once; show_projections only changes their heights
+        self.projection_ax = self.projection_figure.add_subplot(111)
+        self.projection_bars = self.projection_ax.bar(list(PROJECTION_COLUMNS), [0] * len(PROJECTION_COLUMNS), color='skyblue')
+
+    def find_player(self, name):
+        """Look up an active player by name, ignoring case and surrounding whitespace."""
+        return self.player_by_lname.get(name.strip().lower())
+
     def search_player(self, player_num):
         """Search for the player and load their stats."""
         player_name = self.search_bar_1.text() if player_num == 1 else self.search_bar_2.text()
-        matched_player = next((p for p in self.all_players if p['full_name'].lower() == player_name.lower()), None)
+        matched_player = self.find_player(player_name)
 
         if matched_player:
-            if player_num == 1:
-                self.current_player_1 = matched_player
-                self.data_1 = self.load_player_data(matched_player)
-            else:
-                self.current_player_2 = matched_player
-                self.data_2 = self.load_player_data(matched_player)
-            self.update_plot()
+            self.fetch_in_background(
+                (player_num,), lambda df: self.on_stats_loaded(df, matched_player, player_num),
+                self.show_compare_error, self.fetch_career_stats, matched_player['id']
+            )
+
+    def search_both_players(self):
+        """Search for both players and load their stats concurrently."""
+        player_1 = self.find_player(self.search_bar_1.text())
+        player_2 = self.find_player(self.search_bar_2.text())
+
+        if player_1 and player_2:
+            # Fetch each player as its own request on the thread pool, so a newer search in
+            # one bar only discards that player's result and never the other's
+            for player_num in (1, 2):
+                self.search_player(player_num)
+
+    def on_stats_loaded(self, df, player, player_num):
+        """Store a player's fetched stats and refresh the comparison plot."""
+        if player_num == 1:
+            self.current_player_1 = player
+            self.data_1 = self.load_player_data(df)
+        else:
+            self.current_player_2 = player
+            self.data_2 = self.load_player_data(df)
+        self.statusBar().clearMessage()
+        self._plot_cache.clear()
+        self.update_plot()
+
+    def show_compare_error(self, error):
+        """Tell the user a comparison fetch failed, the plot keeps the last loaded data."""
+        self.statusBar().showMessage(f"Error fetching player stats: {error}")
+
+    def fetch_in_background(self, slots, on_loaded, on_failed, fetch, *args):
+        """Run a blocking fetch on the thread pool and hand its result to on_loaded.
+
+        Errors are passed to on_failed instead. Either is dropped if a newer request has
+        since been made for any of the slots.
+        """
+        self._request_counter += 1
+        request_id = self._request_counter
+        for slot in slots:
+            self._latest_request[slot] = request_id
+
+        def is_latest():
+            return all(self._latest_request.get(slot) == request_id for slot in slots)
+
+        def deliver(result):
+            self.stats_workers.discard(worker)
+            if is_latest():
+                on_loaded(result)
+
+        def report(error):
+            self.stats_workers.discard(worker)
+            print(f"Error fetching player stats: {error}")
+            if is_latest():
+                on_failed(error)
+
+        worker = StatsWorker(fetch, *args)
+        worker.signals.finished.connect(deliver)
+        worker.signals.failed.connect(report)
+        # Keep the worker's signals alive until it reports back
+        self.stats_workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
 
     def create_position_filter_tab(self):
         """Create the Position Filtering tab with player navigation."""
@@ -316,8 +642,11 @@ class FantasyDashboard(QMainWindow):
         layout.addWidget(self.position_label)
 
         self.position_dropdown = QComboBox()
-        self.position_dropdown.addItems(["All", "Guard", "Forward", "Center"])
-        self.position_dropdown.currentIndexChanged.connect(self.filter_players_by_position)
+        self.position_dropdown.addItems(list(self.names_by_position))
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.timeout.connect(self.filter_players_by_position)
+        self.position_dropdown.currentIndexChanged.connect(lambda _: self._filter_timer.start(DEBOUNCE_MS))
         layout.addWidget(self.position_dropdown)
 
         # Player list display
@@ -328,8 +657,7 @@ class FantasyDashboard(QMainWindow):
         # Load all players initially
         self.load_all_players()
 
-        # Add this tab to the main widget
-        self.tabs.addTab(position_filter_widget, "Position Filter")
+        return position_filter_widget
 
     def navigate_to_player_stats(self, item):
         """Navigate to the Compare Players tab and search for the selected player."""
@@ -345,176 +673,175 @@ class FantasyDashboard(QMainWindow):
 
     def load_all_players(self):
         """Load all players into the player list widget."""
-        self.player_list_widget.clear()
-        for player in self.all_players:
-            self.player_list_widget.addItem(player['full_name'])
+        self.set_player_list([player['full_name'] for player in self.all_players])
 
     def filter_players_by_position(self):
         """Filter players based on the selected position."""
         position = self.position_dropdown.currentText()
 
-        if position == "All":
-            filtered_players = self.player_positions
-        else:
-            filtered_players = [
-                player for player in self.player_positions if position in player['position']
-            ]
-
         # Update the player list widget
-        self.player_list_widget.clear()
-        for player in filtered_players:
-            self.player_list_widget.addItem(player['name'])
-
-    def load_player_data(self, player):
-        """Load stats for the selected player."""
-        player_id = player['id']
-        career_stats = playercareerstats.PlayerCareerStats(player_id=player_id)
-        df = career_stats.get_data_frames()[0]
-
-        # Ensure TO column exists
-        if 'TO' not in df.columns:
-            df['TO'] = 0
-
-        # Add fantasy score using user-defined settings
-        df['Fantasy Score'] = (
-            df['PTS'] * self.fantasy_settings['PTS'] +
-            df['REB'] * self.fantasy_settings['REB'] +
-            df['AST'] * self.fantasy_settings['AST'] +
-            df['STL'] * self.fantasy_settings['STL'] +
-            df['BLK'] * self.fantasy_settings['BLK'] -
-            df['TO'] * self.fantasy_settings['TO']
-        )
-        df['Points Per Game'] = df['PTS'] / df['GP']
-        df['Rebounds'] = df['REB'] / df['GP']
-        df['Assists'] = df['AST'] / df['GP']
-        df['Efficiency'] = (df['PTS'] + df['REB'] + df['AST']) / df['GP']
-        df['Steals'] = df['STL'] / df['GP']
-        df['Blocks'] = df['BLK'] / df['GP']
+        self.set_player_list(self.names_by_position[position])
 
-
-        return df[['SEASON_ID', 'Fantasy Score', 'Points Per Game', 'Assists', 'Rebounds', 'Efficiency', 'Steals', 'Blocks']]
+    def set_player_list(self, names):
+        """Replace the player list contents with a single batched insert."""
+        # Suspend repaints so the clear and insert show up as a single update
+        self.player_list_widget.setUpdatesEnabled(False)
+        try:
+            self.player_list_widget.clear()
+            self.player_list_widget.addItems(names)
+        finally:
+            self.player_list_widget.setUpdatesEnabled(True)
+
+    def fetch_career_stats(self, player_id):
+        """Fetch a player's career stats, reusing recently fetched responses.
+
+        The returned frame is the cached one itself, so callers must treat it as read-only.
+        """
+        entry = self.career_cache.get(player_id)
+        if entry is None or time.time() - entry[0] >= CAREER_CACHE_TTL:
+            entry = (time.time(), _fetch_career_df(player_id))
+        # Fetches run on worker threads, so update the recency order under a lock
+        with self._cache_lock:
+            self.career_cache[player_id] = entry
+            # Keep the cache bounded, evicting the least recently used player
+            self.career_cache.move_to_end(player_id)
+            while len(self.career_cache) > CAREER_CACHE_SIZE:
+                self.career_cache.popitem(last=False)
+        return entry[1]
+
+    def load_player_data(self, df):
+        """Load stats for the selected player from their career stats frame."""
+        # Derive every metric from the raw arrays and build the result frame in one step
+        metrics = compute_metrics(df[FANTASY_STATS].to_numpy(dtype=np.float64), df['GP'].to_numpy(dtype=np.float64), self.fantasy_coef)
+        return pd.DataFrame({
+            # Season ids repeat across players, store them as a category instead of Python strings
+            'SEASON_ID': pd.Categorical(df['SEASON_ID'], ordered=True),
+            # Career year only depends on row order, so compute it once here rather than per replot
+            'Career Year': np.arange(1, len(df) + 1, dtype=np.int32),
+            # Plotting doesn't need double precision, so halve the size of the metric columns
+            **{column: values.astype(np.float32) for column, values in metrics.items()},
+        })
 
     def update_plot(self):
         """Update the plot based on selected metric."""
         if self.data_1 is None and self.data_2 is None:
             return
 
-        # Clear the current figure
-        self.figure.clear()
-
         # Get selected metric
         metric = self.metric_dropdown.currentText()
         
         # Get normalization choice
         normalize_by = self.normalization_dropdown.currentText()
 
-        # Create a combined dataframe with both players' data
-        combined_df = pd.DataFrame()
-
-        # Normalize player data based on the selected normalization choice
+        # Career Year is precomputed by load_player_data, so replotting only reads columns
         if normalize_by == "Career Year":
-            def normalize_by_career_year(df):
-                df['Career Year'] = df['SEASON_ID'].index + 1
-                return df
-
-            if self.data_1 is not None:
-                self.data_1 = normalize_by_career_year(self.data_1)
-                self.data_1['Player'] = self.current_player_1['full_name']
-                combined_df = pd.concat([combined_df, self.data_1[['Career Year', metric, 'Player']]])
-
-            if self.data_2 is not None:
-                self.data_2 = normalize_by_career_year(self.data_2)
-                self.data_2['Player'] = self.current_player_2['full_name']
-                combined_df = pd.concat([combined_df, self.data_2[['Career Year', metric, 'Player']]])
-
-            x_axis_label = "Career Year"
+            x_col, x_axis_label = 'Career Year', "Career Year"
         else:
-            if self.data_1 is not None:
-                self.data_1['Player'] = self.current_player_1['full_name']
-                combined_df = pd.concat([combined_df, self.data_1[['SEASON_ID', metric, 'Player']]])
-
-            if self.data_2 is not None:
-                self.data_2['Player'] = self.current_player_2['full_name']
-                combined_df = pd.concat([combined_df, self.data_2[['SEASON_ID', metric, 'Player']]])
-
-            x_axis_label = "Season"
-
-        # Sort the dataframe by SEASON_ID or Career Year to align the seasons properly
-        combined_df = combined_df.sort_values(by='SEASON_ID' if normalize_by == "Season Year" else 'Career Year')
-
-        # Plot the data
-        ax = self.figure.add_subplot(111)
-        for player_name in combined_df['Player'].unique():
-            player_data = combined_df[combined_df['Player'] == player_name]
-            ax.plot(
-                player_data['SEASON_ID' if normalize_by == "Season Year" else 'Career Year'],
-                player_data[metric],
-                marker='o' if player_name == self.current_player_1['full_name'] else 'x',
-                label=player_name
-            )
+            x_col, x_axis_label = 'SEASON_ID', "Season"
+
+        # Reuse line data computed earlier for this metric and normalization
+        key = (metric, x_col)
+        if key not in self._plot_cache:
+            self._plot_cache[key] = self.compute_plot_data(metric, x_col)
+        line_data, seasons = self._plot_cache[key]
+
+        # Update the existing lines in place
+        for line, xy, player in zip((self.line1, self.line2), line_data, (self.current_player_1, self.current_player_2)):
+            if xy is None:
+                line.set_data([], [])
+                line.set_label('_nolegend_')
+                continue
+            line.set_data(*xy)
+            line.set_label(player['full_name'])
+
+        if x_col == 'SEASON_ID':
+            self.ax.set_xticks(range(len(seasons)), seasons)
+        else:
+            self.ax.xaxis.set_major_locator(AutoLocator())
+            self.ax.xaxis.set_major_formatter(ScalarFormatter())
 
         # Update plot aesthetics
-        ax.set_title(f"{metric} Over {x_axis_label}")
-        ax.set_xlabel(x_axis_label)
-        ax.set_ylabel(metric)
-        ax.legend()
-        ax.grid(True)
+        self.ax.set_title(f"{metric} Over {x_axis_label}")
+        self.ax.set_xlabel(x_axis_label)
+        self.ax.set_ylabel(metric)
+        # Only rebuild the legend when the plotted players change, not on every metric toggle
+        labels = (self.line1.get_label(), self.line2.get_label())
+        if labels != self._legend_labels:
+            self.ax.legend()
+            self._legend_labels = labels
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+        self.canvas.draw_idle()
+
+    def compute_plot_data(self, metric, x_col):
+        """Compute the x/y arrays for each player's line, plus the season tick labels if any."""
+        frames = (self.data_1, self.data_2)
+
+        # Seasons are strings, so place them at integer positions on a shared, sorted season axis
+        seasons = None
+        if x_col == 'SEASON_ID':
+            seasons = sorted(set().union(*(data['SEASON_ID'] for data in frames if data is not None)))
+            season_positions = {season: i for i, season in enumerate(seasons)}
+
+        line_data = []
+        for data in frames:
+            if data is None:
+                line_data.append(None)
+                continue
+            x = data[x_col]
+            if x_col == 'SEASON_ID':
+                x = x.map(season_positions)
+            line_data.append((x.to_numpy(dtype=float), data[metric].to_numpy()))
+        return line_data, seasons
 
-        self.canvas.draw()
     def generate_projections(self):
         """Generate per-game projections for the selected player."""
         player_name = self.projection_search_bar.text()
-        matched_player = next((p for p in self.all_players if p['full_name'].lower() == player_name.lower()), None)
+        matched_player = self.find_player(player_name)
 
         if not matched_player:
             self.projection_label.setText("Player not found! Try again.")
             return
 
-        player_id = matched_player['id']
-        career_stats = playercareerstats.PlayerCareerStats(player_id=player_id)
-        df = career_stats.get_data_frames()[0]
-
-        # Ensure the TO column exists
-        if 'TO' not in df.columns:
-            df['TO'] = 0  # Assign 0 turnovers if the column is missing
-
-        # Calculate per-game stats
-        df['Points Per Game'] = df['PTS'] / df['GP']
-        df['Rebounds Per Game'] = df['REB'] / df['GP']
-        df['Assists Per Game'] = df['AST'] / df['GP']
-        df['Fantasy Score Per Game'] = (
-            df['Points Per Game'] * self.fantasy_settings['PTS'] +
-            df['Rebounds Per Game'] * self.fantasy_settings['REB'] +
-            df['Assists Per Game'] * self.fantasy_settings['AST'] +
-            df['STL'] / df['GP'] * self.fantasy_settings['STL'] +
-            df['BLK'] / df['GP'] * self.fantasy_settings['BLK'] -
-            df['TO'] / df['GP'] * self.fantasy_settings['TO']
+        self.projection_label.setText(f"Loading projections for {matched_player['full_name']}...")
+        self.fetch_in_background(
+            ('projection',), lambda df: self.show_projections(df, matched_player),
+            lambda error: self.projection_label.setText(f"Error loading projections for {matched_player['full_name']}: {error}"),
+            self.fetch_career_stats, matched_player['id']
         )
 
-        # Take projections as the most recent season's per-game stats
-        latest_season = df.iloc[-1]
-        projections = {
-            "Points": latest_season['Points Per Game'],
-            "Rebounds": latest_season['Rebounds Per Game'],
-            "Assists": latest_season['Assists Per Game'],
-            "Fantasy Score": latest_season['Fantasy Score Per Game']
-        }
+    def show_projections(self, df, matched_player):
+        """Display per-game projections from a player's career stats."""
+        # Derive per-game stats the same way as the comparison plot
+        data = self.load_player_data(df)
+        # Newly signed players have no NBA seasons yet, so there is nothing to project from
+        if data.empty:
+            self.projection_label.setText(f"No career stats yet for {matched_player['full_name']}.")
+            return
+
+        # Take projections as the most recent season's per-game stats, read straight from the arrays
+        projections = {label: data[column].to_numpy()[-1] for label, column in PROJECTION_COLUMNS.items()}
+
+        # A latest season without games played leaves NaN or inf per-game stats, show those as n/a
+        finite = {label: value for label, value in projections.items() if np.isfinite(value)}
 
         # Update label and plot
-        self.projection_label.setText(f"Projected Stats for Next Game:\n"
-                                      f"Points: {projections['Points']:.1f}, "
-                                      f"Rebounds: {projections['Rebounds']:.1f}, "
-                                      f"Assists: {projections['Assists']:.1f}, "
-                                      f"Fantasy Score: {projections['Fantasy Score']:.1f}")
-
-        # Plot projections
-        self.projection_figure.clear()
-        ax = self.projection_figure.add_subplot(111)
-        categories = list(projections.keys())
-        values = list(projections.values())
-        ax.bar(categories, values, color='skyblue')
-        ax.set_title(f"Projections for {matched_player['full_name']}")
-        self.projection_canvas.draw()
+        self.projection_label.setText("Projected Stats for Next Game:\n" + ", ".join(
+            f"{label}: {finite[label]:.1f}" if label in finite else f"{label}: n/a" for label in projections
+        ))
+
+        # Plot projections by resizing the existing bars
+        for bar, label in zip(self.projection_bars, projections):
+            bar.set_height(finite.get(label, 0))
+        # Keep zero on the axis, fantasy scores can go negative with custom settings.
+        # With no finite values this falls back to a 0 to 1 axis
+        values = [0, *finite.values()]
+        low, high = min(values), max(values)
+        margin = (high - low) * 0.1 or 1
+        self.projection_ax.set_ylim(low - margin if low < 0 else 0, high + margin)
+        self.projection_ax.set_title(f"Projections for {matched_player['full_name']}")
+        self.projection_canvas.draw_idle()
 
 
 if __name__ == "__main__":